@@ -8,72 +8,64 @@ This script demonstrates how another project would use i18n-checker
 in their CI/CD pipeline.
 
 Usage:
-    python client_project_demo.py
+    python client_project_demo.py [--pace SECONDS] [--always-report]
 """
 
 import os
 import sys
 import time
+import argparse
 import shutil
-from datetime import datetime
+from i18n_checker._termio import (
+    flush, pace, set_pace, print_step, print_red, print_green,
+    print_yellow, print_blue, print_purple, print_plain
+)
 
-# Colors for terminal output
-colors = {
-    'red': '\033[91m',
-    'green': '\033[92m',
-    'yellow': '\033[93m',
-    'blue': '\033[94m',
-    'purple': '\033[95m',
-    'cyan': '\033[96m',
-    'bold': '\033[1m',
-    'end': '\033[0m'
-}
+# Layout of the demo client project shown in step 1
+_TREE = """→ Project structure:
+  demo-client-project/
+  ├── src/
+  │   └── app.js         (JavaScript application with i18n keys)
+  ├── locales/
+  │   └── en.json        (English translations)
+  ├── package.json       (Node.js project configuration)
+  └── .github/workflows/
+      └── i18n-validation.yml  (GitHub Actions workflow)"""
 
-def print_with_color(message, color):
-    """Print message with color."""
-    print(f"{colors.get(color, '')}{message}{colors['end']}")
-
-def print_step(step, message):
-    """Print a step header."""
-    print_with_color(f"\n[STEP {step}] {message}", "cyan")
-    time.sleep(0.5)
-
-def simulate_client_cicd():
-    """Simulate how a client project would use i18n-checker in CI/CD."""
-    print_with_color("\n===== CLIENT PROJECT CI/CD DEMONSTRATION =====", "blue")
-    print_with_color("This shows how another project would integrate i18n-checker into their workflow", "yellow")
+def simulate_client_cicd(always_report=False):
+    """
+    Simulate how a client project would use i18n-checker in CI/CD.
+    
+    Args:
+        always_report (bool): Generate the report artifact even when the build has failed
+    """
+    print_blue("\n===== CLIENT PROJECT CI/CD DEMONSTRATION =====")
+    print_yellow("This shows how another project would integrate i18n-checker into their workflow")
     
     # Step 1: Project Setup
     print_step("1/5", "Setting up client project")
-    print("→ Project structure:")
-    print("  demo-client-project/")
-    print("  ├── src/")
-    print("  │   └── app.js         (JavaScript application with i18n keys)")
-    print("  ├── locales/")
-    print("  │   └── en.json        (English translations)")
-    print("  ├── package.json       (Node.js project configuration)")
-    print("  └── .github/workflows/")
-    print("      └── i18n-validation.yml  (GitHub Actions workflow)")
+    print_plain(_TREE)
     
     # Step 2: Examining the code
     print_step("2/5", "Examining project code")
-    print("→ app.js contains several i18n keys:")
+    print_plain("→ app.js contains several i18n keys:")
     
     keys = ["welcome.title", "welcome.message", "user.name", "user.email", "errors.unexpected"]
+    keys_set = frozenset(keys)
     for key in keys:
-        print(f"  - {key}")
+        print_plain(f"  - {key}")
     
-    print("\n→ Translation file (en.json) contains:")
+    print_plain("\n→ Translation file (en.json) contains:")
     included_keys = ["welcome.title", "welcome.message", "user.name", "user.email", "buttons.save"]
     for key in included_keys:
-        if key in keys:
-            print_with_color(f"  ✓ {key}", "green")
+        if key in keys_set:
+            print_green(f"  ✓ {key}")
         else:
-            print(f"  - {key}")
+            print_plain(f"  - {key}")
     
     # Step 3: CI/CD Integration
     print_step("3/5", "CI/CD Integration")
-    print("→ GitHub Actions workflow:")
+    print_plain("→ GitHub Actions workflow:")
     
     workflow_steps = [
         "1. Check out code repository",
@@ -84,23 +76,23 @@ def simulate_client_cicd():
         "6. Upload report as build artifact"
     ]
     
-    for step in workflow_steps:
-        print(f"  - {step}")
+    print_plain("\n".join(f"  - {step}" for step in workflow_steps))
     
     # Step 4: Running i18n validation
     print_step("4/5", "Running i18n validation")
-    print("→ Executing validation command:")
-    print_with_color("  $ i18n-checker --scan . --format html --output client_i18n_report.html", "yellow")
-    time.sleep(1)
+    print_plain("→ Executing validation command:")
+    print_yellow("  $ i18n-checker --scan . --format html --output client_i18n_report.html")
+    flush()
+    pace(1)
     
     # Simulate results
     missing_key = "errors.unexpected"
     unused_key = "buttons.save"
     
-    print("\n→ Validation results:")
-    print_with_color(f"  ❌ Missing key: {missing_key}", "red")
-    print(f"    Found in: src/app.js:21")
-    print_with_color(f"  ⚠️ Unused key: {unused_key}", "yellow")
+    print_plain("\n→ Validation results:")
+    print_red(f"  ❌ Missing key: {missing_key}")
+    print_plain(f"    Found in: src/app.js:21")
+    print_yellow(f"  ⚠️ Unused key: {unused_key}")
     
     # Step 5: CI/CD actions
     print_step("5/5", "CI/CD pipeline actions")
@@ -110,43 +102,64 @@ def simulate_client_cicd():
     missing_count = 1
     
     if missing_count > threshold:
-        print_with_color(f"  ❌ Build failed: {missing_count} missing keys exceeds threshold of {threshold}", "red")
+        print_red(f"  ❌ Build failed: {missing_count} missing keys exceeds threshold of {threshold}")
         status = "failed"
     else:
-        print_with_color(f"  ✅ Build passed: {missing_count} missing keys is below threshold of {threshold}", "green")
+        print_green(f"  ✅ Build passed: {missing_count} missing keys is below threshold of {threshold}")
         status = "passed"
     
-    # Artifact creation
-    print("\n→ Generated artifacts:")
-    print_with_color(f"  📄 i18n validation report: client_i18n_report.html", "purple")
-    
-    # Create a simple HTML file for demo purposes
-    with open("client_i18n_report.html", "w") as f:
-        f.write("<html><body><h1>i18n Validation Report</h1>")
-        f.write("<h2>Missing Keys (1)</h2><ul>")
-        f.write(f'<li style="color:red">{missing_key} - src/app.js:21</li>')
-        f.write("</ul><h2>Unused Keys (1)</h2><ul>")
-        f.write(f'<li style="color:orange">{unused_key}</li>')
-        f.write("</ul></body></html>")
+    # Artifact creation (the report is only published for passing builds)
+    if status == "failed" and not always_report:
+        print_yellow("\n→ Build already failed, skipping artifact generation (use --always-report to force)")
+    else:
+        print_plain("\n→ Generated artifacts:")
+        print_purple(f"  📄 i18n validation report: client_i18n_report.html")
+    
+        # Create a simple HTML file for demo purposes
+        html = (
+            "<html><body><h1>i18n Validation Report</h1>"
+            "<h2>Missing Keys (1)</h2><ul>"
+            f'<li style="color:red">{missing_key} - src/app.js:21</li>'
+            "</ul><h2>Unused Keys (1)</h2><ul>"
+            f'<li style="color:orange">{unused_key}</li>'
+            "</ul></body></html>"
+        )
+        with open("client_i18n_report.html", "w", buffering=65536) as f:
+            f.write(html)
     
     # Final status
-    print_with_color("\n===== CI/CD PIPELINE RESULT =====", "blue")
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    print_blue("\n===== CI/CD PIPELINE RESULT =====")
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
     
     if status == "passed":
-        print_with_color(f"✅ BUILD PASSED | {timestamp}", "green")
-        print_with_color("i18n validation successful. Minor issues found.", "green")
+        print_green(f"✅ BUILD PASSED | {timestamp}")
+        print_green("i18n validation successful. Minor issues found.")
     else:
-        print_with_color(f"❌ BUILD FAILED | {timestamp}", "red")
-        print_with_color("i18n validation failed. Please fix missing keys.", "red")
+        print_red(f"❌ BUILD FAILED | {timestamp}")
+        print_red("i18n validation failed. Please fix missing keys.")
     
-    print("\n→ Next steps for the development team:")
-    print("  1. Review the i18n report")
-    print("  2. Add missing translations")
-    print("  3. Remove unused keys if they're no longer needed")
-    print("  4. Run validation again before merging")
+    print_plain("\n→ Next steps for the development team:")
+    print_plain("  1. Review the i18n report")
+    print_plain("  2. Add missing translations")
+    print_plain("  3. Remove unused keys if they're no longer needed")
+    print_plain("  4. Run validation again before merging")
     
-    print_with_color("\nThis demonstrates how i18n-checker integrates into any project's CI/CD workflow", "yellow")
+    print_yellow("\nThis demonstrates how i18n-checker integrates into any project's CI/CD workflow")
+    flush()
     
 if __name__ == "__main__":
-    simulate_client_cicd() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Client project CI/CD demo for i18n-checker")
+    parser.add_argument(
+        "--pace",
+        help="Pause multiplier between demo steps (default: 0, no pauses)",
+        type=float,
+        default=0.0
+    )
+    parser.add_argument(
+        "--always-report",
+        help="Generate the report artifact even if the build fails",
+        action="store_true"
+    )
+    cli_args = parser.parse_args()
+    set_pace(cli_args.pace)
+    simulate_client_cicd(always_report=cli_args.always_report) 
\ No newline at end of file
@@ -8,139 +8,154 @@ This script demonstrates how the i18n-checker can be integrated into a CI/CD pip
 for automated internationalization validation.
 
 Usage:
-    python demo_cicd.py
+    python demo_cicd.py [--pace SECONDS] [--always-report]
 
 This will:
 1. Scan a sample codebase for i18n issues
-2. Generate an HTML report
-3. Simulate a CI/CD pipeline validation step
+2. Simulate a CI/CD pipeline validation step
+3. Generate an HTML report
 """
 
 import os
 import sys
 import time
 import argparse
-from datetime import datetime
 from i18n_checker.checker import run_checker
+from i18n_checker._termio import (
+    flush, set_pace, print_step, print_red, print_green,
+    print_yellow, print_blue, print_plain
+)
 
-def print_with_color(message, color):
-    """Print message with color."""
-    colors = {
-        'red': '\033[91m',
-        'green': '\033[92m',
-        'yellow': '\033[93m',
-        'blue': '\033[94m',
-        'purple': '\033[95m',
-        'cyan': '\033[96m',
-        'end': '\033[0m'
-    }
-    print(f"{colors.get(color, '')}{message}{colors['end']}")
 
-def simulate_cicd_pipeline():
-    """Simulate a CI/CD pipeline for demonstration purposes."""
-    print_with_color("\n===== CI/CD PIPELINE DEMONSTRATION =====", "blue")
-    print_with_color("Starting i18n validation in CI/CD pipeline...", "blue")
+def count_findings(findings):
+    """Count keys in a set/list of keys or occurrences in a dict of key -> locations."""
+    if isinstance(findings, dict):
+        return sum(map(len, findings.values()))
+    if hasattr(findings, '__len__'):
+        return len(findings)
+    return sum(1 for _ in findings)
+
+def simulate_cicd_pipeline(always_report=False):
+    """
+    Simulate a CI/CD pipeline for demonstration purposes.
+    
+    Args:
+        always_report (bool): Generate the report artifact even when the build has already failed
+    """
+    print_blue("\n===== CI/CD PIPELINE DEMONSTRATION =====")
+    print_blue("Starting i18n validation in CI/CD pipeline...")
     
     # Step 1: Prepare environment
-    print_with_color("\n[STEP 1/5] Preparing environment...", "cyan")
-    time.sleep(1)
-    print("→ Checking for test code directory...")
-    if not os.path.exists("test_code"):
-        print_with_color("  ✗ Test code directory not found!", "red")
+    print_step("1/5", "Preparing environment...", pause=1)
+    print_plain("→ Checking for test code directory...")
+    if not os.path.isdir("test_code"):
+        print_red("  ✗ Test code directory not found!")
+        flush()
         return False
-    print_with_color("  ✓ Test code directory found", "green")
+    print_green("  ✓ Test code directory found")
     
     # Step 2: Set up args for the i18n checker
-    print_with_color("\n[STEP 2/5] Setting up i18n checker...", "cyan")
-    time.sleep(1)
+    print_step("2/5", "Setting up i18n checker...", pause=1)
+    
+    # The build fails once more keys than this are missing
+    threshold = 5  # Increased threshold for demonstration purposes
     
     class Args:
-        def __init__(self):
+        def __init__(self, always_report=False):
             self.scan = './test_code'
             self.fix = True
             self.output = 'ci_cd_report.html'
             self.format = 'html'
+            self.always_report = always_report
+            # A failing build publishes no report, so the scan can stop once it is known to fail
+            self.max_missing = None if always_report else threshold
     
-    args = Args()
-    print_with_color("  ✓ i18n checker configured", "green")
+    args = Args(always_report)
+    print_green("  ✓ i18n checker configured")
     
-    # Step 3: Run the checker
-    print_with_color("\n[STEP 3/5] Running i18n validation...", "cyan")
-    time.sleep(1)
-    print("→ Scanning for i18n issues...")
+    # Step 3: Run the checker (a single pass that also writes the report)
+    print_step("3/5", "Running i18n validation...", pause=1)
+    print_plain("→ Scanning for i18n issues...")
+    flush()
     
     start_time = time.time()
     try:
         result = run_checker(args)
         duration = time.time() - start_time
         if result:
-            print_with_color(f"  ✓ Scan completed in {duration:.2f} seconds", "green")
+            print_green(f"  ✓ Scan completed in {duration:.2f} seconds")
         else:
-            print_with_color("  ✗ Scan failed!", "red")
+            print_red("  ✗ Scan failed!")
+            flush()
             return False
     except Exception as e:
-        print_with_color(f"  ✗ Error during scan: {str(e)}", "red")
+        print_red(f"  ✗ Error during scan: {str(e)}")
+        flush()
         return False
     
     # Step 4: Analyze results
-    print_with_color("\n[STEP 4/5] Analyzing results...", "cyan")
-    time.sleep(1)
-    
-    # Handle missing_keys which could be a dict or a set
-    missing_keys = result.get('missing_keys', {})
-    unused_keys = result.get('unused_keys', set())
-    
-    # Calculate total missing keys based on the data structure
-    if isinstance(missing_keys, dict):
-        total_missing = sum(len(keys) for keys in missing_keys.values())
-    elif isinstance(missing_keys, set):
-        total_missing = len(missing_keys)
-    else:
-        # Fallback for any other type
-        total_missing = len(list(missing_keys)) if hasattr(missing_keys, '__len__') else 0
+    print_step("4/5", "Analyzing results...", pause=1)
     
-    # For unused keys (also handle both possible data structures)
-    if isinstance(unused_keys, dict):
-        total_unused = sum(len(keys) for keys in unused_keys.values())
+    total_missing = count_findings(result["missing_keys"])
+    total_unused = count_findings(result["unused_keys"])
+    if result.get("stopped_early"):
+        print_plain(f"→ Found more than {threshold} missing keys, stopped scanning early")
     else:
-        total_unused = len(unused_keys)
-    
-    print(f"→ Found {total_missing} missing keys and {total_unused} unused keys")
+        print_plain(f"→ Found {total_missing} missing keys and {total_unused} unused keys")
     
     # Determine if this would pass or fail in a real CI pipeline
-    threshold = 5  # Increased threshold for demonstration purposes
     if total_missing > threshold:
-        print_with_color(f"  ✗ Too many missing keys (threshold: {threshold})", "red")
+        print_red(f"  ✗ Too many missing keys (threshold: {threshold})")
         status = "failed"
     else:
-        print_with_color(f"  ✓ Missing keys within acceptable threshold", "green")
+        print_green(f"  ✓ Missing keys within acceptable threshold")
         status = "passed"
     
     # Step 5: Generate report artifact
-    print_with_color("\n[STEP 5/5] Generating artifacts...", "cyan")
-    time.sleep(1)
+    print_step("5/5", "Generating artifacts...", pause=1)
     
-    if os.path.exists(args.output):
-        print_with_color(f"  ✓ Report generated at: {args.output}", "green")
-        report_size = os.path.getsize(args.output) / 1024  # KB
-        print(f"    Report size: {report_size:.2f} KB")
+    # The report is only published for passing builds, so none is written for a known failure
+    if status == "failed" and not args.always_report:
+        print_yellow("  ↷ Build already failed, skipping artifact generation (use --always-report to force)")
     else:
-        print_with_color(f"  ✗ Failed to generate report at: {args.output}", "red")
+        try:
+            report_stat = os.stat(args.output)
+        except FileNotFoundError:
+            print_red(f"  ✗ Failed to generate report at: {args.output}")
+        else:
+            print_green(f"  ✓ Report generated at: {args.output}")
+            report_size = report_stat.st_size / 1024  # KB
+            print_plain(f"    Report size: {report_size:.2f} KB")
     
     # Final CI/CD status
-    print_with_color("\n===== CI/CD PIPELINE RESULT =====", "blue")
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    print_blue("\n===== CI/CD PIPELINE RESULT =====")
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
     
     if status == "passed":
-        print_with_color(f"✅ BUILD PASSED | {timestamp}", "green")
-        print_with_color("i18n validation successful. Report artifact generated.", "green")
+        print_green(f"✅ BUILD PASSED | {timestamp}")
+        print_green("i18n validation successful. Report artifact generated.")
     else:
-        print_with_color(f"❌ BUILD FAILED | {timestamp}", "red")
-        print_with_color("i18n validation failed. Too many i18n issues found.", "red")
-        print_with_color("Please fix the issues and try again.", "red")
+        print_red(f"❌ BUILD FAILED | {timestamp}")
+        print_red("i18n validation failed. Too many i18n issues found.")
+        print_red("Please fix the issues and try again.")
     
+    flush()
     return status == "passed"
 
 if __name__ == "__main__":
-    success = simulate_cicd_pipeline()
+    parser = argparse.ArgumentParser(description="CI/CD pipeline demo for i18n-checker")
+    parser.add_argument(
+        "--pace",
+        help="Pause multiplier between pipeline steps (default: 0, no pauses)",
+        type=float,
+        default=0.0
+    )
+    parser.add_argument(
+        "--always-report",
+        help="Generate the report artifact even if the build fails",
+        action="store_true"
+    )
+    cli_args = parser.parse_args()
+    set_pace(cli_args.pace)
+    success = simulate_cicd_pipeline(always_report=cli_args.always_report)
     sys.exit(0 if success else 1) 
\ No newline at end of file
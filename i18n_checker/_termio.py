@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Terminal output helpers shared by the i18n-checker demo scripts.
+
+Output is queued in a module-level ColorWriter and written to stdout in one
+call per flush, with ANSI colors only when stdout is a terminal.
+"""
+
+import sys
+import time
+
+# Colors for terminal output
+colors = {
+    'red': '\033[91m',
+    'green': '\033[92m',
+    'yellow': '\033[93m',
+    'blue': '\033[94m',
+    'purple': '\033[95m',
+    'cyan': '\033[96m',
+    'bold': '\033[1m',
+    'end': '\033[0m'
+}
+
+# Pause multiplier between demo steps (0 disables pausing, e.g. in CI)
+_PACE = 0.0
+
+class ColorWriter:
+    """Buffer terminal lines and write them to stdout in a single call."""
+
+    def __init__(self, stream=None):
+        # None writes to whatever sys.stdout is at flush time, so redirection is honoured
+        self.stream = stream
+        # Precomputed (prefix, suffix) pairs for each color name, with and without ANSI codes;
+        # one table is picked per flush depending on whether the stream is a terminal
+        self._color_wrap = {name: (code, colors['end']) for name, code in colors.items() if name != 'end'}
+        self._color_wrap[None] = ("", "")
+        self._plain_wrap = dict.fromkeys(self._color_wrap, ("", ""))
+        self._buf = []  # Queued (color, message) pairs
+
+    def write(self, message, color=None):
+        """Queue a line of output, colored if a color name is given."""
+        self._buf.append((color if color in self._color_wrap else None, message))
+
+    def printer(self, color=None):
+        """Return a function that queues lines in the given color."""
+        if color not in self._color_wrap:
+            raise KeyError(color)
+        append = self._buf.append
+
+        def print_line(message=""):
+            append((color, message))
+        return print_line
+
+    def flush(self):
+        """Write all queued lines to the stream."""
+        if self._buf:
+            stream = self.stream if self.stream is not None else sys.stdout
+            # Only emit ANSI color codes when writing to a terminal
+            wrap = self._color_wrap if stream.isatty() else self._plain_wrap
+            stream.write("".join([
+                f"{wrap[color][0]}{message}{wrap[color][1]}\n" for color, message in self._buf
+            ]))
+            self._buf.clear()
+            stream.flush()
+
+_writer = ColorWriter()
+
+def set_pace(multiplier):
+    """Set the multiplier applied to every pause (0 disables pausing)."""
+    global _PACE
+    _PACE = multiplier
+
+def pace(seconds):
+    """Pause for a number of seconds scaled by the pace multiplier."""
+    if _PACE:
+        time.sleep(_PACE * seconds)
+
+def flush():
+    """Write all queued output to stdout."""
+    _writer.flush()
+
+def print_with_color(message, color):
+    """Print message with color."""
+    _writer.write(message, color)
+
+print_red = _writer.printer("red")
+print_green = _writer.printer("green")
+print_yellow = _writer.printer("yellow")
+print_blue = _writer.printer("blue")
+print_purple = _writer.printer("purple")
+print_cyan = _writer.printer("cyan")
+print_plain = _writer.printer()
+
+def print_step(step, message, pause=0.5):
+    """Print a step header, flush pending output and pause."""
+    print_cyan(f"\n[STEP {step}] {message}")
+    _writer.flush()
+    pace(pause)
@@ -16,12 +16,132 @@ Supported file types:
 """
 
 import argparse
+import functools
+import mmap
 import os
 import json
 import re
+import sys
 from collections import defaultdict
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Dict, Set, List, Tuple
 
+try:
+    import ijson
+except ImportError:  # Optional, only used to stream large translation files
+    ijson = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # Optional, faster decoding of translation files
+    orjson = None
+    _json_loads = json.loads
+
+try:
+    import re2
+except ImportError:  # Optional, faster key matching on large codebases
+    re2 = None
+
+# Errors raised when a translation file is not valid JSON
+# (orjson.JSONDecodeError is a subclass of json.JSONDecodeError)
+JSON_ERRORS = (json.JSONDecodeError,) if ijson is None else (json.JSONDecodeError, ijson.JSONError)
+
+# File extensions scanned by the checker, mapped to the file type they are grouped under
+FILE_TYPES = {
+    "json": "json",
+    "py": "python",
+    "js": "js_ts",
+    "ts": "js_ts",
+    "vue": "vue",
+}
+
+# Location listed for an unused key whose translation file could not be determined
+_UNKNOWN_LOCATIONS = (("Unknown", "unknown"),)
+
+# Directories that never contain project sources or translations (dependencies, VCS data, build output, caches)
+_SKIP_DIRS = frozenset({
+    "node_modules", ".git", "__pycache__", "venv", ".venv", "dist", "build",
+    ".tox", ".mypy_cache", ".pytest_cache", "target",
+})
+
+# Display names of source languages in the HTML report, by file extension
+_EXT_TO_LANG = {
+    ".py": "Python",
+    ".js": "JavaScript",
+    ".ts": "TypeScript",
+    ".vue": "Vue",
+}
+
+# Language codes in translation file names (en.json, pt_BR.json) and directory names (fr/, en_US/)
+_LANG_FILE_RE = re.compile(r'([a-z]{2})(?:_[A-Z]{2})?\.')
+_LANG_DIR_RE = re.compile(r'[a-z]{2}(?:_[A-Z]{2})?$')
+
+# Translation files at least this large are streamed with ijson when it is installed
+STREAM_JSON_MIN_BYTES = 1 << 20
+
+# Minimum total size of the scanned files before an opted-in scan (--jobs) is spread over
+# worker processes; starting a spawn-based pool costs about as much as scanning this much
+PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+
+# Source files at least this large are memory-mapped and scanned as bytes instead of read into a str
+MMAP_MIN_BYTES = 64 * 1024
+
+def compile_key_pattern(pattern):
+    """
+    Compile an i18n key pattern, with RE2 over bytes when it is installed.
+    
+    Args:
+        pattern (str): Regular expression with the key in its last group
+        
+    Returns:
+        Compiled pattern matching str, or bytes when RE2 is used
+    """
+    if re2 is not None:
+        return re2.compile(pattern.encode("utf-8"))
+    return re.compile(pattern)
+
+@functools.lru_cache(maxsize=None)
+def bytes_key_pattern(pattern):
+    """
+    Return a version of a compiled key pattern that matches bytes.
+    
+    Args:
+        pattern: Compiled key pattern from compile_key_pattern
+        
+    Returns:
+        Compiled pattern matching bytes (the pattern itself if it already does)
+    """
+    if isinstance(pattern.pattern, bytes):
+        return pattern
+    return re.compile(pattern.pattern.encode("utf-8"), pattern.flags & ~re.UNICODE)
+
+def key_hints(*hints):
+    """Encode pattern hint substrings to match the type of text being scanned."""
+    if re2 is not None:
+        return tuple(hint.encode("utf-8") for hint in hints)
+    return hints
+
+# i18n key patterns, one alternation per call form so each file is scanned once per pattern.
+# Patterns whose matches can contain another call (t({ ... t('key') })) get their own pass,
+# since an alternation would consume the inner call.
+# Files are matched as a whole, so quoted keys and whitespace never span a newline.
+# The hints are substrings every match contains, used to skip files without i18n calls.
+# _('key') or gettext('key')
+_PY_KEY_PATTERNS = (compile_key_pattern(r'(?:_|gettext)\(["\']([^"\'\n]+)["\']\)'),)
+_PY_KEY_HINTS = key_hints("_(", "gettext(")
+# t('key'), t.namespace('key') or this.$t('key'), then t({ key: 'value' })
+_JS_KEY_PATTERNS = (
+    compile_key_pattern(r'(?:this\.\$t|t(?:\.\w+)?)\(["\']([^"\'\n]+)["\']\)'),
+    compile_key_pattern(r't\(\{.*?["\']key["\']:[^\S\n]*["\']([^"\'\n]+)["\'].*?\}\)'),
+)
+_JS_KEY_HINTS = key_hints("t(", "t.")
+# $t('key'), i18n.t('key') or t('key')
+_VUE_KEY_PATTERNS = (compile_key_pattern(r'(?:\$t|i18n\.t|t)\(["\']([^"\'\n]+)["\']\)'),)
+_VUE_KEY_HINTS = key_hints("t(")
+
 
 def find_files(directory, extensions):
     """
@@ -41,6 +161,113 @@ def find_files(directory, extensions):
                 found_files.append(os.path.join(root, file))
     return found_files
 
+def map_files(executor, workers, func, files):
+    """
+    Apply a per-file function to each file, in worker processes if an executor is given.
+    
+    If the worker processes die (for example when the calling script has no
+    ``if __name__ == "__main__":`` guard under the spawn start method), the
+    remaining files are processed in-process instead.
+    
+    Args:
+        executor (ProcessPoolExecutor or None): Pool to run on, or None to run in-process
+        workers (int): Number of worker processes in the pool
+        func (callable): Top-level function taking a file path
+        files (list): List of file paths
+        
+    Returns:
+        iterator: Results of func, in the same order as files
+    """
+    if executor is None:
+        return map(func, files)
+    warning = f"⚠️ Worker processes are unavailable, running {func.__name__} in this process instead"
+    chunksize = max(1, len(files) // (workers * 4))
+    try:
+        results = executor.map(func, files, chunksize=chunksize)
+    except BrokenProcessPool:
+        print(warning)
+        return map(func, files)
+
+    def serial_on_broken_pool():
+        # Yield pool results, switching to in-process calls for the rest if the pool breaks
+        done = 0
+        try:
+            for result in results:
+                yield result
+                done += 1
+        except BrokenProcessPool:
+            print(warning)
+            yield from map(func, files[done:])
+    return serial_on_broken_pool()
+
+def file_size(file_path):
+    """
+    Get the size of a file, treating files that cannot be read (e.g. dangling symlinks) as empty.
+    
+    Args:
+        file_path (str): Path to the file
+        
+    Returns:
+        int: Size of the file in bytes, or 0 if it cannot be stat'ed
+    """
+    try:
+        return os.path.getsize(file_path)
+    except OSError:
+        return 0
+
+def collect_files(directory):
+    """
+    Find all scannable files in the directory in a single pass, grouped by type.
+    
+    Files are visited in the same order as os.walk, but each directory is read
+    once with os.scandir instead of once per extension. Hidden directories,
+    dependency and build directories (see _SKIP_DIRS) and the checker's own
+    Python sources are skipped.
+    
+    Args:
+        directory (str): Directory to scan
+        
+    Returns:
+        dict: Mapping of "json", "python", "js_ts" and "vue" to lists of file paths
+    """
+    found_files = {file_type: [] for file_type in set(FILE_TYPES.values())}
+    stack = [directory]
+    while stack:
+        path = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Like os.walk, don't descend into symlinked directories
+                        if not (entry.is_symlink() or entry.name in _SKIP_DIRS or entry.name.startswith(".")):
+                            subdirs.append(entry.path)
+                        continue
+                    _, dot, ext = entry.name.rpartition(".")
+                    file_type = FILE_TYPES.get(ext) if dot else None
+                    if file_type is None:
+                        continue
+                    if file_type == "python" and is_checker_source(entry.path):
+                        continue
+                    found_files[file_type].append(entry.path)
+        except OSError:
+            continue
+        # Push in reverse so subdirectories are visited in listing order
+        stack.extend(reversed(subdirs))
+    return found_files
+
+def is_checker_source(file_path):
+    """
+    Check whether a Python file belongs to the checker itself and should not be scanned.
+    
+    Args:
+        file_path (str): Path to the Python file
+        
+    Returns:
+        bool: True if the file should be skipped
+    """
+    return os.path.basename(file_path) == "check_locales.py" or "i18n_checker" in file_path
+
 def extract_keys_from_json(file_path, parent_key=""):
     """
     Extract all keys from a JSON file, including nested keys.
@@ -54,16 +281,80 @@ def extract_keys_from_json(file_path, parent_key=""):
     """
     keys = set()
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            keys = extract_nested_keys(data, parent_key)
-    except json.JSONDecodeError:
+        keys = load_json_keys(file_path, parent_key)
+    except JSON_ERRORS:
         print(f"⚠️ Error: Could not parse {file_path}. Skipping...")
     return keys
 
+def load_json_keys(file_path, parent_key=""):
+    """
+    Parse a JSON file into its nested keys.
+    
+    Args:
+        file_path (str): Path to the JSON file
+        parent_key (str): Parent key for nested objects
+        
+    Returns:
+        set: All keys in the JSON file
+        
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    # Stream large files when ijson is available instead of building the whole document
+    if ijson is not None and os.path.getsize(file_path) >= STREAM_JSON_MIN_BYTES:
+        with open(file_path, "rb") as f:
+            return extract_keys_from_json_events(ijson.parse(f), parent_key)
+
+    with open(file_path, "rb") as f:
+        data = _json_loads(f.read())
+    return extract_nested_keys(data, parent_key)
+
+def extract_keys_from_json_events(events, parent_key=""):
+    """
+    Extract nested keys from a stream of ijson parse events.
+    
+    Produces the same keys as extract_nested_keys without materializing the
+    document, so memory use stays flat for large translation files.
+    
+    Args:
+        events: Iterable of (prefix, event, value) tuples from ijson.parse
+        parent_key (str): Parent key for nested objects
+        
+    Returns:
+        set: Set of extracted keys
+    """
+    keys = set()
+    # One frame per open container: [path, current key (object) or next index (array), is_array]
+    stack = []
+    for _, event, value in events:
+        if event == "map_key":
+            frame = stack[-1]
+            frame[1] = f"{frame[0]}.{value}" if frame[0] else value
+            keys.add(frame[1])
+            continue
+        if event == "end_map" or event == "end_array":
+            stack.pop()
+            continue
+        
+        # Every other event starts a value; work out the path it lives under
+        if not stack:
+            path = parent_key
+        elif stack[-1][2]:
+            frame = stack[-1]
+            path = f"{frame[0]}[{frame[1]}]"
+            frame[1] += 1
+        else:
+            path = stack[-1][1]
+        
+        if event == "start_map":
+            stack.append([path, None, False])
+        elif event == "start_array":
+            stack.append([path, 0, True])
+    return keys
+
 def extract_nested_keys(data, parent_key=""):
     """
-    Recursively extract nested keys from a dictionary.
+    Extract nested keys from a dictionary.
     
     Args:
         data: Dictionary, list or primitive to extract keys from
@@ -73,16 +364,23 @@ def extract_nested_keys(data, parent_key=""):
         set: Set of extracted keys
     """
     keys = set()
-    if isinstance(data, dict):
-        for key, value in data.items():
-            full_key = f"{parent_key}.{key}" if parent_key else key
-            keys.add(full_key)
-            keys.update(extract_nested_keys(value, full_key))
-    elif isinstance(data, list):
-        for i, item in enumerate(data):
-            keys.update(extract_nested_keys(item, f"{parent_key}[{i}]"))
+    # Walk containers with an explicit stack into a single set instead of recursing
+    stack = [(data, parent_key)]
+    while stack:
+        node, node_key = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                full_key = f"{node_key}.{key}" if node_key else key
+                keys.add(full_key)
+                if isinstance(value, (dict, list)):
+                    stack.append((value, full_key))
+        elif isinstance(node, list):
+            for i, item in enumerate(node):
+                if isinstance(item, (dict, list)):
+                    stack.append((item, f"{node_key}[{i}]"))
     return keys
 
+@functools.lru_cache(maxsize=1024)
 def determine_language_from_path(file_path):
     """
     Determine the language from the file path.
@@ -93,51 +391,149 @@ def determine_language_from_path(file_path):
     Returns:
         str: Detected language code
     """
-    # Try to find language code in the path
-    file_base = os.path.basename(file_path)
-    file_dir = os.path.dirname(file_path)
-    
     # Check if the filename itself is a language code (e.g., en.json, fr.json)
-    lang_match = re.match(r'([a-z]{2})(_[A-Z]{2})?\.', file_base)
+    lang_match = _LANG_FILE_RE.match(os.path.basename(file_path))
     if lang_match:
         return lang_match.group(1)
     
     # Check if a parent directory is a language code
-    path_parts = file_dir.split(os.path.sep)
-    for part in reversed(path_parts):
-        if re.match(r'^[a-z]{2}(_[A-Z]{2})?$', part):
+    return language_from_directory(os.path.dirname(file_path))
+
+@functools.lru_cache(maxsize=1024)
+def language_from_directory(directory):
+    """
+    Determine the language from the nearest parent directory named after a language code.
+    
+    Args:
+        directory (str): Directory containing the file
+        
+    Returns:
+        str: Detected language code, or "unknown" if no directory is a language code
+    """
+    for part in reversed(directory.split(os.path.sep)):
+        if _LANG_DIR_RE.match(part):
             return part
     
     # Default to "unknown" if we can't determine
     return "unknown"
 
-def extract_used_keys_from_python(file_path):
+def find_keys_in_text(pattern, file_path, text):
     """
-    Extract i18n keys used in Python files (e.g., _('greeting'), gettext('user.name')).
+    Find i18n keys matched by a key pattern anywhere in a file's contents.
     
     Args:
-        file_path (str): Path to the Python file
+        pattern (re.Pattern): Compiled key pattern; the key is its last matched group
+        file_path (str): Path of the file the text was read from
+        text (str, bytes or mmap): Full contents of the file; bytes are decoded as UTF-8 per match
+        
+    Returns:
+        dict: Dictionary mapping keys to (file_path, line_num, line_content) tuples
+    """
+    used_keys = defaultdict(list)
+    is_bytes = not isinstance(text, str)
+    newline = b"\n" if is_bytes else "\n"
+    if isinstance(text, mmap.mmap):
+        # mmap has no count(), so only the span between two matches is copied out
+        def count_newlines(start, end):
+            return text[start:end].count(newline)
+    else:
+        count_newlines = functools.partial(text.count, newline)
+    # Bound once, as they are called for every match
+    rfind = text.rfind
+    find = text.find
+    line_num = 1
+    last_pos = 0
+
+    # Matches arrive in order, so line numbers are advanced by counting newlines since the last one
+    for match in pattern.finditer(text):
+        pos = match.start()
+        line_num += count_newlines(last_pos, pos)
+        last_pos = pos
+        line_start = rfind(newline, 0, pos) + 1
+        line_end = find(newline, pos)
+        line = text[line_start:line_end] if line_end != -1 else text[line_start:]
+        key = match.group(match.lastindex)
+        if is_bytes:
+            key = key.decode("utf-8", "replace")
+            line = line.decode("utf-8", "replace")
+        used_keys[key].append((file_path, line_num, line.strip()))
+
+    return used_keys
+
+def find_keys_with_patterns(patterns, file_path, text):
+    """
+    Find i18n keys matched by any of several key patterns, one pass per pattern.
+    
+    Args:
+        patterns (tuple): Compiled key patterns; the key is the last matched group of each
+        file_path (str): Path of the file the text was read from
+        text (str, bytes or mmap): Full contents of the file
+        
+    Returns:
+        dict: Dictionary mapping keys to (file_path, line_num, line_content) tuples, in line order
+    """
+    used_keys = find_keys_in_text(patterns[0], file_path, text)
+    for pattern in patterns[1:]:
+        for key, locations in find_keys_in_text(pattern, file_path, text).items():
+            existing = used_keys[key]
+            existing.extend(locations)
+            if len(existing) > len(locations):
+                # Keys found by several passes are put back in line order (stable, so pass order within a line)
+                existing.sort(key=itemgetter(1))
+    return used_keys
+
+def scan_source_file(file_path, patterns, hints):
+    """
+    Read a source file and find the i18n keys matched by its key patterns.
+    
+    Files are read as bytes when the patterns are compiled with RE2, which is
+    fastest on raw bytes, and as text otherwise. Large files are memory-mapped
+    and scanned as bytes without being copied or decoded.
+    
+    Args:
+        file_path (str): Path to the source file
+        patterns (tuple): Compiled key patterns from compile_key_pattern
+        hints (tuple): Substrings at least one of which every match contains
         
     Returns:
         dict: Dictionary mapping keys to their locations in the file
     """
-    key_pattern = re.compile(r'_\(["\']([^"\']+)["\']\)|gettext\(["\']([^"\']+)["\']\)')
-    used_keys = {}
+    used_keys = defaultdict(list)
 
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                matches = key_pattern.findall(line)
-                for match in matches:
-                    key = match[0] if match[0] else match[1]
-                    if key not in used_keys:
-                        used_keys[key] = []
-                    used_keys[key].append((file_path, line_num, line.strip()))
+        if os.path.getsize(file_path) >= MMAP_MIN_BYTES:
+            with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                byte_hints = (hint.encode("utf-8") if isinstance(hint, str) else hint for hint in hints)
+                if any(mm.find(hint) != -1 for hint in byte_hints):
+                    byte_patterns = tuple(bytes_key_pattern(pattern) for pattern in patterns)
+                    used_keys = find_keys_with_patterns(byte_patterns, file_path, mm)
+        else:
+            if re2 is not None:
+                with open(file_path, "rb") as f:
+                    text = f.read()
+            else:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    text = f.read()
+            # A substring check is far cheaper than the regex and rules out files without i18n calls
+            if any(hint in text for hint in hints):
+                used_keys = find_keys_with_patterns(patterns, file_path, text)
     except Exception as e:
         print(f"⚠️ Error reading {file_path}: {e}")
-    
+
     return used_keys
 
+def extract_used_keys_from_python(file_path):
+    """
+    Extract i18n keys used in Python files (e.g., _('greeting'), gettext('user.name')).
+    
+    Args:
+        file_path (str): Path to the Python file
+        
+    Returns:
+        dict: Dictionary mapping keys to their locations in the file
+    """
+    return scan_source_file(file_path, _PY_KEY_PATTERNS, _PY_KEY_HINTS)
+
 def extract_used_keys_from_js_ts(file_path):
     """
     Extract 
@@ -155,28 +551,7 @@ def extract_used_keys_from_js_ts(file_path):
     Returns:
         dict: Dictionary mapping keys to their locations in the file
     """
-    key_patterns = [
-        r't\(["\']([^"\']+)["\']\)',  # Matches t("key") or t('key')
-        r't\.\w+\(["\']([^"\']+)["\']\)',  # Matches t.namespace("key")
-        r't\(\{.*?["\']key["\']:\s*["\']([^"\']+)["\'].*?\}\)',  # Matches t({ key: "value" })
-        r'this.\$t\(["\']([^"\']+)["\']\)',  # Matches Vue's this.$t("key")
-    ]
-
-    used_keys = {}
-    
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                for pattern in key_patterns:
-                    matches = re.findall(pattern, line)
-                    for key in matches:
-                        if key not in used_keys:
-                            used_keys[key] = []
-                        used_keys[key].append((file_path, line_num, line.strip()))
-    except Exception as e:
-        print(f"⚠️ Error reading {file_path}: {e}")
-
-    return used_keys
+    return scan_source_file(file_path, _JS_KEY_PATTERNS, _JS_KEY_HINTS)
 
 def extract_used_keys_from_vue(file_path):
     """
@@ -193,34 +568,15 @@ def extract_used_keys_from_vue(file_path):
     Returns:
         dict: Dictionary mapping keys to their locations in the file
     """
-    key_patterns = [
-        r'\$t\(["\']([^"\']+)["\']\)',  # Matches $t("key") or $t('key')
-        r't\(["\']([^"\']+)["\']\)',    # Matches t("key") or t('key')
-        r'i18n\.t\(["\']([^"\']+)["\']\)',  # Matches i18n.t("key")
-    ]
-    
-    used_keys = {}
-    
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                for pattern in key_patterns:
-                    matches = re.findall(pattern, line)
-                    for key in matches:
-                        if key not in used_keys:
-                            used_keys[key] = []
-                        used_keys[key].append((file_path, line_num, line.strip()))
-    except Exception as e:
-        print(f"⚠️ Error reading {file_path}: {e}")
-        
-    return used_keys
+    return scan_source_file(file_path, _VUE_KEY_PATTERNS, _VUE_KEY_HINTS)
 
-def find_json_key_locations(json_files: List[str]) -> Dict[str, List[Tuple[str, str]]]:
+def find_json_key_locations(json_files: List[str], json_file_keys: Dict[str, Set[str]] = None) -> Dict[str, List[Tuple[str, str]]]:
     """
     Find which JSON files contain each key.
     
     Args:
         json_files (List[str]): List of JSON file paths
+        json_file_keys (Dict[str, Set[str]]): Keys already extracted for each file, if available
         
     Returns:
         Dict[str, List[Tuple[str, str]]]: Dictionary mapping keys to tuples of (file_path, language)
@@ -230,77 +586,86 @@ def find_json_key_locations(json_files: List[str]) -> Dict[str, List[Tuple[str,
     for file_path in json_files:
         try:
             language = determine_language_from_path(file_path)
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                keys = extract_nested_keys(data)
-                for key in keys:
-                    key_locations[key].append((file_path, language))
-        except json.JSONDecodeError:
+            if json_file_keys is not None:
+                keys = json_file_keys[file_path]
+            else:
+                keys = load_json_keys(file_path)
+            for key in keys:
+                key_locations[key].append((file_path, language))
+        except JSON_ERRORS:
             print(f"⚠️ Error: Could not parse {file_path}. Skipping...")
             
     return key_locations
 
-def suggest_fix_for_missing_key(key: str, json_files: List[str]) -> Dict[str, str]:
+def find_suggestion_target(json_files: List[str]) -> str:
     """
-    Suggest a fix for missing keys by creating placeholder entries.
+    Choose the JSON file that fix suggestions for missing keys are added to.
     
     Args:
-        key (str): The missing key
         json_files (List[str]): List of JSON file paths
         
     Returns:
-        Dict[str, str]: Dictionary mapping file paths to suggested JSON content
+        str: Path of the target file, or None if there are no JSON files
     """
-    suggestions = {}
-    
-    # Find best JSON file to add the key to
-    target_file = None
     for file in json_files:
         if file.endswith("en.json"):  # Prefer English as base language
-            target_file = file
-            break
+            return file
     
-    if not target_file and json_files:
-        target_file = json_files[0]  # Use first available if no English
+    return json_files[0] if json_files else None  # Use first available if no English
+
+def suggest_fix_for_missing_key(key: str, target_file: str) -> Dict[str, str]:
+    """
+    Suggest a fix for missing keys by creating placeholder entries.
+    
+    Args:
+        key (str): The missing key
+        target_file (str): JSON file to add the key to, from find_suggestion_target
         
+    Returns:
+        Dict[str, str]: Dictionary mapping file paths to suggested JSON content
+    """
+    suggestions = {}
+    
     if not target_file:
         return suggestions
         
     # Create a placeholder value
     if "." in key:
+        # Render the nested object directly, laid out as json.dumps(..., indent=4) would
         parts = key.split(".")
-        nested_obj = {}
-        current = nested_obj
-        
-        for i, part in enumerate(parts):
-            if i == len(parts) - 1:
-                current[part] = f"MISSING: {key}"
-            else:
-                current[part] = {}
-                current = current[part]
+        depth = len(parts)
+        lines = ["{"]
+        for i, part in enumerate(parts[:-1], 1):
+            lines.append(f"{'    ' * i}{json.dumps(part)}: {{")
+        lines.append(f"{'    ' * depth}{json.dumps(parts[-1])}: {json.dumps(f'MISSING: {key}')}")
+        for i in range(depth - 1, -1, -1):
+            lines.append(f"{'    ' * i}}}")
                 
-        suggestions[target_file] = json.dumps(nested_obj, indent=4)
+        suggestions[target_file] = "\n".join(lines)
     else:
         suggestions[target_file] = f'{{ "{key}": "MISSING: {key}" }}'
         
     return suggestions
 
-def generate_html_report(missing_keys, unused_keys, used_keys, json_key_locations, missing_key_suggestions, fix_missing):
+def stream_html_report(missing_keys, unused_key_locations, used_keys, missing_key_suggestions, fix_missing):
     """
-    Generate an HTML report with tabular format.
+    Generate an HTML report with tabular format, one chunk at a time.
+    
+    The report is never held in memory as a whole, so it can be written out
+    with report.writelines() as it is produced. Keys are listed in the order
+    given, so callers pass them already sorted (see generate_html_report).
     
     Args:
-        missing_keys (Set[str]): Keys used in code but missing in translations
-        unused_keys (Set[str]): Keys in translations but not used in code
+        missing_keys (List[str]): Sorted keys used in code but missing in translations
+        unused_key_locations (Dict): Unused keys, in sorted order, mapped to their JSON locations
         used_keys (Dict): Dictionary of used keys with their locations
-        json_key_locations (Dict): Dictionary of JSON keys with their locations
         missing_key_suggestions (Dict): Dictionary of suggested fixes
         fix_missing (bool): Whether fix suggestions are enabled
         
-    Returns:
-        str: HTML content for the report
+    Yields:
+        str: Consecutive chunks of HTML content for the report
     """
-    html_content = """<!DOCTYPE html>
+    yield """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -383,7 +748,7 @@ def generate_html_report(missing_keys, unused_keys, used_keys, json_key_location
     
     # Missing keys table
     if missing_keys:
-        html_content += """
+        yield """
         <table>
             <thead>
                 <tr>
@@ -397,21 +762,15 @@ def generate_html_report(missing_keys, unused_keys, used_keys, json_key_location
             <tbody>
 """
         
-        for i, key in enumerate(sorted(missing_keys)):
+        # Determine the language of each source file once from its extension
+        file_langs = {}
+        
+        for i, key in enumerate(missing_keys):
             for j, (file_path, line_num, _) in enumerate(used_keys[key]):
-                # For each occurrence determine language from file extension/path
-                file_ext = os.path.splitext(file_path)[1]
-                lang = ""
-                if file_ext == ".py":
-                    lang = "Python"
-                elif file_ext == ".js":
-                    lang = "JavaScript"
-                elif file_ext == ".ts":
-                    lang = "TypeScript"
-                elif file_ext == ".vue":
-                    lang = "Vue"
-                
-                html_content += f"""
+                lang = file_langs.get(file_path)
+                if lang is None:
+                    lang = file_langs[file_path] = _EXT_TO_LANG.get(os.path.splitext(file_path)[1], "")
+                yield f"""
                 <tr>
                     <td>{i if j==0 else ''}</td>
                     <td class="key-path">'{key}'</td>
@@ -420,35 +779,35 @@ def generate_html_report(missing_keys, unused_keys, used_keys, json_key_location
                     <td><span class="language-tag">{lang}</span></td>
                 </tr>"""
         
-        html_content += """
+        yield """
             </tbody>
         </table>
 """
 
         # Add suggestions if enabled
         if fix_missing:
-            html_content += "<h3>Suggestions to Fix Missing Keys</h3>"
-            for key in sorted(missing_keys):
+            yield "<h3>Suggestions to Fix Missing Keys</h3>"
+            for key in missing_keys:
                 if key in missing_key_suggestions:
                     for file_path, json_content in missing_key_suggestions[key].items():
-                        html_content += f"""
+                        yield f"""
         <div>
             <p>For key <code class="key-path">{key}</code>, add to <code class="file-path">{file_path}</code>:</p>
             <div class="suggestion">{json_content}</div>
         </div>"""
     else:
-        html_content += '<p class="none-found">✅ No missing keys found!</p>'
+        yield '<p class="none-found">✅ No missing keys found!</p>'
     
     # Unused keys section
-    html_content += """
+    yield """
     </div>
     
     <div class="container">
         <h2>🗑️ Unused Keys (Present in JSON but Not Used in Code)</h2>
 """
     
-    if unused_keys:
-        html_content += """
+    if unused_key_locations:
+        yield """
         <table>
             <thead>
                 <tr>
@@ -461,9 +820,9 @@ def generate_html_report(missing_keys, unused_keys, used_keys, json_key_location
             <tbody>
 """
         
-        for i, key in enumerate(sorted(unused_keys)):
-            for j, (file_path, language) in enumerate(json_key_locations.get(key, [("Unknown", "unknown")])):
-                html_content += f"""
+        for i, (key, locations) in enumerate(unused_key_locations.items()):
+            for j, (file_path, language) in enumerate(locations):
+                yield f"""
                 <tr>
                     <td>{i if j==0 else ''}</td>
                     <td class="key-path">'{key}'</td>
@@ -471,25 +830,67 @@ def generate_html_report(missing_keys, unused_keys, used_keys, json_key_location
                     <td><span class="language-tag">{language}</span></td>
                 </tr>"""
         
-        html_content += """
+        yield """
             </tbody>
         </table>
 """
     else:
-        html_content += '<p class="none-found">✅ No unused keys found!</p>'
+        yield '<p class="none-found">✅ No unused keys found!</p>'
     
-    html_content += """
+    yield """
     </div>
 </body>
 </html>
 """
+
+def generate_html_report(missing_keys, unused_keys, used_keys, json_key_locations, missing_key_suggestions, fix_missing):
+    """
+    Generate an HTML report with tabular format.
     
-    return html_content
+    Args:
+        missing_keys (Set[str]): Keys used in code but missing in translations
+        unused_keys (Set[str]): Keys in translations but not used in code
+        used_keys (Dict): Dictionary of used keys with their locations
+        json_key_locations (Dict): Dictionary of JSON keys with their locations
+        missing_key_suggestions (Dict): Dictionary of suggested fixes
+        fix_missing (bool): Whether fix suggestions are enabled
+        
+    Returns:
+        str: HTML content for the report
+    """
+    return "".join(stream_html_report(
+        sorted(missing_keys),
+        locate_unused_keys(sorted(unused_keys), json_key_locations),
+        used_keys,
+        missing_key_suggestions,
+        fix_missing
+    ))
+
+def locate_unused_keys(unused_keys, json_key_locations):
+    """
+    Look up the JSON files defining each unused key, once per key.
+    
+    Args:
+        unused_keys (List[str]): Unused keys, in the order they should be reported
+        json_key_locations (Dict): Dictionary of JSON keys with their locations
+        
+    Returns:
+        Dict[str, List[Tuple[str, str]]]: Unused keys, in the given order, mapped to (file_path, language) tuples
+    """
+    return {key: json_key_locations.get(key, _UNKNOWN_LOCATIONS) for key in unused_keys}
 
 def run_checker(args=None):
     """
     Main function that coordinates the scanning and reporting process.
     
+    Scanning runs in this process unless ``args.jobs`` asks for more than one
+    worker (0 means one per CPU) and the files total at least PARALLEL_MIN_BYTES.
+    
+    If ``args.max_missing`` is set, scanning stops as soon as more than that
+    many distinct keys are missing, and no report is written. The result then
+    has ``stopped_early`` set, and its missing keys are those seen so far.
+    Its unused keys are left empty, since not all code was scanned.
+    
     Args:
         args: Command line arguments (optional, for programmatic use)
         
@@ -502,12 +903,16 @@ def run_checker(args=None):
         parser.add_argument("--fix", help="Generate suggestions to fix missing keys", action="store_true")
         parser.add_argument("--output", help="Output file for detailed report (default: i18n_report.txt)")
         parser.add_argument("--format", help="Output format: txt or html (default: txt)", choices=["txt", "html"], default="txt")
+        parser.add_argument("--jobs", help="Worker processes for large scans, 0 for one per CPU (default: 1)", type=int, default=1)
         args = parser.parse_args()
 
     scan_dir = args.scan
     output_file = args.output if args.output else f"i18n_report.{args.format}"
     fix_missing = args.fix
     output_format = args.format
+    max_missing = getattr(args, "max_missing", None)
+    jobs = getattr(args, "jobs", None)
+    jobs = 1 if jobs is None else jobs
 
     if not os.path.exists(scan_dir):
         print(f"Error: Directory {scan_dir} does not exist!")
@@ -515,87 +920,118 @@ def run_checker(args=None):
 
     print(f"📂 Scanning directory: {scan_dir}")
 
-    # Scan JSON files
-    json_files = find_files(scan_dir, ".json")
-    all_json_keys = set()
-    
-    if json_files:
-        print(f"✅ Found {len(json_files)} JSON file(s):")
-        for file in json_files:
-            print(f"🔍 Extracting keys from: {file}")
-            keys = extract_keys_from_json(file)
-            all_json_keys.update(keys)
-    
-    # Find which JSON file contains each key
-    json_key_locations = find_json_key_locations(json_files)
-
-    # Scan Python files
-    python_files = find_files(scan_dir, ".py")
-    python_files = [file for file in python_files if os.path.basename(file) != "check_locales.py" and "i18n_checker" not in file]
-    
-    used_keys = {}  # Dictionary mapping keys to where they're used
-    
-    if python_files:
-        print(f"\n🐍 Scanning {len(python_files)} Python file(s) for used i18n keys:")
-        for file in python_files:
-            print(f"🔎 Checking: {file}")
-            keys = extract_used_keys_from_python(file)
-            for key, locations in keys.items():
-                if key not in used_keys:
-                    used_keys[key] = []
-                used_keys[key].extend(locations)
-
-    # Scan JS/TS files
-    js_ts_files = find_files(scan_dir, (".js", ".ts"))
-
-    if js_ts_files:
-        print(f"\n📜 Scanning {len(js_ts_files)} JavaScript/TypeScript file(s) for used i18n keys:")
-        for file in js_ts_files:
-            print(f"🔎 Checking: {file}")
-            keys = extract_used_keys_from_js_ts(file)
-            for key, locations in keys.items():
-                if key not in used_keys:
-                    used_keys[key] = []
-                used_keys[key].extend(locations)
-    
-    # Scan Vue files
-    vue_files = find_files(scan_dir, ".vue")
-    
-    if vue_files:
-        print(f"\n🖼️ Scanning {len(vue_files)} Vue file(s) for used i18n keys:")
-        for file in vue_files:
-            print(f"🔎 Checking: {file}")
-            keys = extract_used_keys_from_vue(file)
-            for key, locations in keys.items():
-                if key not in used_keys:
-                    used_keys[key] = []
-                used_keys[key].extend(locations)
+    files = collect_files(scan_dir)
+    json_files = files["json"]
+    python_files = files["python"]
+    js_ts_files = files["js_ts"]
+    vue_files = files["vue"]
+
+    # Files are scanned independently, so large codebases can be spread over worker
+    # processes; this is opt-in, as spawned workers re-import the calling script
+    workers = jobs if jobs > 0 else (os.cpu_count() or 1)
+    executor = None
+    if workers > 1:
+        all_files = json_files + python_files + js_ts_files + vue_files
+        if sum(map(file_size, all_files)) >= PARALLEL_MIN_BYTES:
+            executor = ProcessPoolExecutor(max_workers=workers)
+
+    try:
+        # Every scan is submitted before any results are consumed, so worker processes
+        # move straight on to the next file type; results are still read in file order
+        json_results = map_files(executor, workers, extract_keys_from_json, json_files)
+        code_scans = (
+            (f"\n🐍 Scanning {len(python_files)} Python file(s) for used i18n keys:",
+             python_files, map_files(executor, workers, extract_used_keys_from_python, python_files)),
+            (f"\n📜 Scanning {len(js_ts_files)} JavaScript/TypeScript file(s) for used i18n keys:",
+             js_ts_files, map_files(executor, workers, extract_used_keys_from_js_ts, js_ts_files)),
+            (f"\n🖼️ Scanning {len(vue_files)} Vue file(s) for used i18n keys:",
+             vue_files, map_files(executor, workers, extract_used_keys_from_vue, vue_files)),
+        )
+
+        # Scan JSON files
+        all_json_keys = set()
+        json_file_keys = {}
+        
+        if json_files:
+            print(f"✅ Found {len(json_files)} JSON file(s):")
+            for file, keys in zip(json_files, json_results):
+                print(f"🔍 Extracting keys from: {file}")
+                json_file_keys[file] = keys
+                all_json_keys.update(keys)
+        
+        # Find which JSON file contains each key, reusing the keys extracted above
+        if json_files:
+            json_key_locations = find_json_key_locations(json_files, json_file_keys)
+        else:
+            json_key_locations = defaultdict(list)
+
+        # Scan Python, JS/TS and Vue files
+        used_keys = defaultdict(list)  # Dictionary mapping keys to where they're used
+        missing_seen = set()  # Only tracked when the scan may stop early
+        stopped_early = False
+        
+        for header, code_paths, results in code_scans:
+            if not code_paths or stopped_early:
+                continue
+            print(header)
+            for file, keys in zip(code_paths, results):
+                print(f"🔎 Checking: {file}")
+                for key, locations in keys.items():
+                    used_keys[key].extend(locations)
+                if max_missing is not None:
+                    missing_seen.update(key for key in keys if key not in all_json_keys)
+                    if len(missing_seen) > max_missing:
+                        stopped_early = True
+                        break
+    finally:
+        if executor is not None:
+            # Don't wait for files still queued after an early stop or an error
+            if sys.version_info >= (3, 9):
+                executor.shutdown(cancel_futures=True)
+            else:
+                executor.shutdown()
+
+    if stopped_early:
+        print(f"\n⛔ More than {max_missing} missing keys found, stopped scanning without writing a report")
+        return {
+            "missing_keys": missing_seen,
+            "unused_keys": set(),
+            "used_keys": used_keys,
+            "json_key_locations": json_key_locations,
+            "stopped_early": True
+        }
 
     # Compare JSON keys and used keys
     used_key_set = set(used_keys.keys())
-    missing_keys = used_key_set - all_json_keys
-    unused_keys = all_json_keys - used_key_set
+    if not all_json_keys or not used_key_set:
+        # One side is empty, so every key on the other side is missing or unused
+        missing_keys = used_key_set
+        unused_keys = all_json_keys
+    else:
+        missing_keys = used_key_set - all_json_keys
+        unused_keys = all_json_keys - used_key_set
+    # Sorted and located once, then shared by the report and the console summary
+    missing_sorted = sorted(missing_keys)
+    unused_locs = locate_unused_keys(sorted(unused_keys), json_key_locations)
 
     # Generate missing key suggestions if requested
     missing_key_suggestions = {}
     if fix_missing and missing_keys:
+        target_file = find_suggestion_target(json_files)
         for key in missing_keys:
-            missing_key_suggestions[key] = suggest_fix_for_missing_key(key, json_files)
+            missing_key_suggestions[key] = suggest_fix_for_missing_key(key, target_file)
 
     # Generate report based on format
     if output_format == "html":
         # Generate HTML report
-        html_content = generate_html_report(
-            missing_keys,
-            unused_keys,
-            used_keys,
-            json_key_locations,
-            missing_key_suggestions,
-            fix_missing
-        )
-        
         with open(output_file, "w", encoding="utf-8") as report:
-            report.write(html_content)
+            report.writelines(stream_html_report(
+                missing_sorted,
+                unused_locs,
+                used_keys,
+                missing_key_suggestions,
+                fix_missing
+            ))
     else:
         # Generate text report (default)
         with open(output_file, "w", encoding="utf-8") as report:
@@ -607,7 +1043,7 @@ def run_checker(args=None):
             report.write("🚨 MISSING KEYS (Used in Code but Not in JSON):\n")
             report.write("------------------------------------------------------\n")
             if missing_keys:
-                for key in sorted(missing_keys):
+                for key in missing_sorted:
                     report.write(f"❌ Missing Key: {key}\n")
                     report.write(f"   Used in:\n")
                     for file_path, line_num, line_content in used_keys[key]:
@@ -625,37 +1061,42 @@ def run_checker(args=None):
             report.write("🗑️ UNUSED KEYS (Present in JSON but Not Used in Code):\n")
             report.write("------------------------------------------------------\n")
             if unused_keys:
-                for key in sorted(unused_keys):
+                for key, locations in unused_locs.items():
                     report.write(f"⚠️ Unused Key: {key}\n")
                     report.write(f"   Defined in:\n")
-                    for file_path, lang in json_key_locations.get(key, [("Unknown", "unknown")]):
+                    for file_path, lang in locations:
                         report.write(f"   - {file_path} ({lang})\n")
                     report.write("\n")
             else:
                 report.write("✅ No unused keys found!\n\n")
 
-    # Display summary to console
-    print("\n🚨 Missing Keys (Used in Code but Not in JSON):")
+    # Display summary to console, written in one call per section
+    lines = ["\n🚨 Missing Keys (Used in Code but Not in JSON):"]
     if missing_keys:
-        for key in sorted(missing_keys):
-            print(f" ❌ {key}")
+        for key in missing_sorted:
+            lines.append(f" ❌ {key}")
             # Print first occurrence
-            if key in used_keys and used_keys[key]:
-                file_path, line_num, _ = used_keys[key][0]
-                print(f"    First seen in: {file_path}:{line_num}")
+            locations = used_keys.get(key)
+            if locations:
+                file_path, line_num, _ = locations[0]
+                lines.append(f"    First seen in: {file_path}:{line_num}")
     else:
-        print(" ✅ None!")
+        lines.append(" ✅ None!")
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
 
-    print("\n🗑️ Unused Keys (Present in JSON but Not Used in Code):")
+    lines = ["\n🗑️ Unused Keys (Present in JSON but Not Used in Code):"]
     if unused_keys:
-        for key in sorted(unused_keys):
-            print(f" ⚠️ {key}")
-            # Print where it's defined
-            if key in json_key_locations:
-                for file_path, lang in json_key_locations[key][:1]:  # Just show first file
-                    print(f"    Defined in: {file_path} ({lang})")
+        for key, locations in unused_locs.items():
+            lines.append(f" ⚠️ {key}")
+            # Print where it's defined (every unused key comes from a scanned JSON file)
+            if locations is not _UNKNOWN_LOCATIONS:
+                for file_path, lang in locations[:1]:  # Just show first file
+                    lines.append(f"    Defined in: {file_path} ({lang})")
     else:
-        print(" ✅ None!")
+        lines.append(" ✅ None!")
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
         
     print(f"\n📝 Detailed report written to: {output_file}")
     
@@ -663,5 +1104,6 @@ def run_checker(args=None):
         "missing_keys": missing_keys,
         "unused_keys": unused_keys,
         "used_keys": used_keys,
-        "json_key_locations": json_key_locations
+        "json_key_locations": json_key_locations,
+        "stopped_early": False
     }   
\ No newline at end of file
@@ -39,6 +39,12 @@ def main():
         choices=["txt", "html"], 
         default="txt"
     )
+    parser.add_argument(
+        "--jobs", 
+        help="Number of worker processes for large scans, 0 for one per CPU (default: 1)", 
+        type=int, 
+        default=1
+    )
     
     args = parser.parse_args()
     
@@ -29,6 +29,9 @@ setup(
         "Operating System :: OS Independent",
     ],
     python_requires=">=3.6",
+    extras_require={
+        "speedups": ["ijson", "google-re2", "orjson"],
+    },
     entry_points={
         "console_scripts": [
             "i18n-checker=i18n_checker.cli:main",
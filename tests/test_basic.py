@@ -2,14 +2,28 @@
 Basic tests for i18n-checker functionality.
 """
 import os
+import io
 import json
 import tempfile
 import unittest
+import contextlib
+from concurrent.futures.process import BrokenProcessPool
+from i18n_checker import _termio
 from i18n_checker.checker import (
     find_files,
+    collect_files,
     extract_keys_from_json,
     extract_nested_keys,
-    determine_language_from_path
+    extract_keys_from_json_events,
+    determine_language_from_path,
+    find_suggestion_target,
+    suggest_fix_for_missing_key,
+    extract_used_keys_from_js_ts,
+    extract_used_keys_from_vue,
+    run_checker,
+    map_files,
+    generate_html_report,
+    MMAP_MIN_BYTES
 )
 
 class TestI18nChecker(unittest.TestCase):
@@ -59,6 +73,32 @@ class TestI18nChecker(unittest.TestCase):
         json_files = find_files(self.test_dir.name, ".json")
         self.assertEqual(len(json_files), 1)
         
+    def test_collect_files(self):
+        """Test grouping files by type in a single directory walk."""
+        sub_dir = os.path.join(self.test_dir.name, "src")
+        os.makedirs(sub_dir)
+        for name in ("app.py", "app.js", "app.ts", "App.vue", "notes.txt"):
+            with open(os.path.join(sub_dir, name), "w") as f:
+                f.write("")
+                
+        files = collect_files(self.test_dir.name)
+        self.assertEqual(files["json"], [self.json_path])
+        self.assertEqual(files["python"], [os.path.join(sub_dir, "app.py")])
+        self.assertEqual(sorted(files["js_ts"]), [os.path.join(sub_dir, "app.js"), os.path.join(sub_dir, "app.ts")])
+        self.assertEqual(files["vue"], [os.path.join(sub_dir, "App.vue")])
+        
+    def test_collect_files_skips_dependency_dirs(self):
+        """Test that dependency, build and hidden directories are not walked."""
+        for dir_name in ("node_modules", ".git", "build"):
+            skipped_dir = os.path.join(self.test_dir.name, dir_name)
+            os.makedirs(skipped_dir)
+            with open(os.path.join(skipped_dir, "index.js"), "w") as f:
+                f.write("")
+                
+        files = collect_files(self.test_dir.name)
+        self.assertEqual(files["js_ts"], [])
+        self.assertEqual(files["json"], [self.json_path])
+        
     def test_extract_keys_from_json(self):
         """Test extracting keys from a JSON file."""
         keys = extract_keys_from_json(self.json_path)
@@ -71,6 +111,30 @@ class TestI18nChecker(unittest.TestCase):
         expected_keys = {"greeting", "user", "user.name", "user.email", "messages"}
         self.assertEqual(keys, expected_keys)
         
+    def test_extract_keys_from_json_events(self):
+        """Test extracting nested keys from streamed JSON parse events."""
+        events = [
+            ("", "start_map", None),
+            ("", "map_key", "greeting"),
+            ("greeting", "string", "Hello"),
+            ("", "map_key", "user"),
+            ("user", "start_map", None),
+            ("user", "map_key", "name"),
+            ("user.name", "string", "User name"),
+            ("user", "end_map", None),
+            ("", "map_key", "items"),
+            ("items", "start_array", None),
+            ("items.item", "string", "first"),
+            ("items.item", "start_map", None),
+            ("items.item", "map_key", "label"),
+            ("items.item.label", "string", "second"),
+            ("items.item", "end_map", None),
+            ("items", "end_array", None),
+            ("", "end_map", None),
+        ]
+        keys = extract_keys_from_json_events(events)
+        self.assertEqual(keys, {"greeting", "user", "user.name", "items", "items[1].label"})
+        
     def test_determine_language_from_path(self):
         """Test determining language from file path."""
         # Test with language in filename
@@ -84,5 +148,141 @@ class TestI18nChecker(unittest.TestCase):
             f.write("{}")
         self.assertEqual(determine_language_from_path(fr_path), "fr")
         
+    def test_suggest_fix_for_missing_key(self):
+        """Test that nested suggestions are rendered as indented JSON in the English file."""
+        fr_path = os.path.join(self.test_dir.name, "fr.json")
+        target_file = find_suggestion_target([fr_path, self.json_path])
+        self.assertEqual(target_file, self.json_path)
+        
+        suggestions = suggest_fix_for_missing_key("user.profile.age", target_file)
+        expected = {"user": {"profile": {"age": "MISSING: user.profile.age"}}}
+        self.assertEqual(suggestions, {self.json_path: json.dumps(expected, indent=4)})
+        self.assertEqual(suggest_fix_for_missing_key("age", None), {})
+        
+    def test_extract_used_keys_from_js_ts_and_vue(self):
+        """Test that each i18n call is recorded once per occurrence."""
+        js_path = os.path.join(self.test_dir.name, "app.js")
+        with open(js_path, "w") as f:
+            f.write("t('greeting');\nthis.$t('user.name');\nt.ns('user.email');\n")
+        keys = extract_used_keys_from_js_ts(js_path)
+        self.assertEqual(sorted(keys), ["greeting", "user.email", "user.name"])
+        self.assertEqual([loc[1] for loc in keys["user.name"]], [2])
+        
+        nested_path = os.path.join(self.test_dir.name, "nested.js")
+        with open(nested_path, "w") as f:
+            f.write('t({ "key": "a", other: t("b") });\nt("a");\n')
+        keys = extract_used_keys_from_js_ts(nested_path)
+        self.assertEqual(sorted(keys), ["a", "b"])
+        self.assertEqual([loc[1] for loc in keys["a"]], [1, 2])
+        
+        vue_path = os.path.join(self.test_dir.name, "app.vue")
+        with open(vue_path, "w") as f:
+            f.write("<p>{{ $t('greeting') }}</p>\n<p>{{ i18n.t('user.name') }}</p>\n")
+        keys = extract_used_keys_from_vue(vue_path)
+        self.assertEqual(sorted(keys), ["greeting", "user.name"])
+        self.assertEqual(len(keys["greeting"]), 1)
+        self.assertEqual(len(keys["user.name"]), 1)
+        
+    def test_extract_used_keys_from_large_file(self):
+        """Test that memory-mapped large files report the same keys and line numbers."""
+        js_path = os.path.join(self.test_dir.name, "bundle.js")
+        filler = "// é filler\n" * (MMAP_MIN_BYTES // 10)
+        with open(js_path, "w", encoding="utf-8") as f:
+            f.write(filler + "t('greeting');\n")
+        keys = extract_used_keys_from_js_ts(js_path)
+        self.assertEqual(keys["greeting"], [(js_path, MMAP_MIN_BYTES // 10 + 1, "t('greeting');")])
+        
+    def test_run_checker_rescan_after_edit(self):
+        """Test that a second run in the same process reports the edited file's lines."""
+        js_path = os.path.join(self.test_dir.name, "a.js")
+        
+        class Args:
+            scan = self.test_dir.name
+            fix = False
+            output = os.path.join(self.test_dir.name, "report.txt")
+            format = "txt"
+            
+        for source, expected in (
+            ("t('one');\nt('two');\n", [(js_path, 2, "t('two');")]),
+            ("t('zero');\nt('three');\nt('two');\n", [(js_path, 3, "t('two');")]),
+        ):
+            with open(js_path, "w") as f:
+                f.write(source)
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = run_checker(Args())
+            self.assertEqual(result["used_keys"]["two"], expected)
+        
+    def test_run_checker_max_missing(self):
+        """Test that the scan stops without a report once too many keys are missing."""
+        with open(os.path.join(self.test_dir.name, "app.py"), "w") as f:
+            f.write("_('greeting')\n_('missing.one')\n_('missing.two')\n")
+            
+        class Args:
+            scan = self.test_dir.name
+            fix = False
+            output = os.path.join(self.test_dir.name, "report.txt")
+            format = "txt"
+            max_missing = 1
+            
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = run_checker(Args())
+        self.assertTrue(result["stopped_early"])
+        self.assertEqual(result["missing_keys"], {"missing.one", "missing.two"})
+        self.assertFalse(os.path.exists(Args.output))
+        
+        Args.max_missing = 2
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = run_checker(Args())
+        self.assertFalse(result["stopped_early"])
+        self.assertTrue(os.path.exists(Args.output))
+        
+    def test_run_checker_jobs_with_dangling_symlink(self):
+        """Test that a dangling symlink does not break sizing the files for worker processes."""
+        os.symlink(os.path.join(self.test_dir.name, "gone.js"), os.path.join(self.test_dir.name, "broken.js"))
+        
+        class Args:
+            scan = self.test_dir.name
+            fix = False
+            output = os.path.join(self.test_dir.name, "report.txt")
+            format = "txt"
+            jobs = 2
+            
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = run_checker(Args())
+        self.assertFalse(result["stopped_early"])
+        
+    def test_map_files_falls_back_on_broken_pool(self):
+        """Test that files left unscanned by a broken worker pool are scanned in-process."""
+        class BrokenAfterFirst:
+            def map(self, func, files, chunksize=1):
+                yield func(files[0])
+                raise BrokenProcessPool("worker died")
+                
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            results = list(map_files(BrokenAfterFirst(), 2, len, ["a", "bb", "ccc"]))
+        self.assertEqual(results, [1, 2, 3])
+        self.assertEqual(output.getvalue().count("Worker processes are unavailable"), 1)
+        
+    def test_generate_html_report_sorts_keys(self):
+        """Test that the HTML report lists keys from unsorted sets in sorted order."""
+        used_keys = {
+            "b.key": [("app.py", 2, "_('b.key')")],
+            "a.key": [("app.py", 1, "_('a.key')")],
+        }
+        json_key_locations = {"z.key": [(self.json_path, "en")], "y.key": [(self.json_path, "en")]}
+        html = generate_html_report({"b.key", "a.key"}, {"z.key", "y.key"}, used_keys, json_key_locations, {}, False)
+        self.assertLess(html.index("'a.key'"), html.index("'b.key'"))
+        self.assertLess(html.index("'y.key'"), html.index("'z.key'"))
+        
+    def test_termio_follows_redirected_stdout(self):
+        """Test that queued demo output goes to sys.stdout as it is when flushed."""
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            _termio.print_red("failed")
+            _termio.print_plain("done")
+            _termio.flush()
+        self.assertEqual(buf.getvalue(), "failed\ndone\n")
+        
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file